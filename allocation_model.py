@@ -1,30 +1,29 @@
-#diff --git a/allocation_model.py b/allocation_model.py
-#new file mode 100644
-#index 0000000000000000000000000000000000000000..c085dca4c2b54ca1014587573892c56bcde84a82
-#--- /dev/null
-# b/allocation_model.py
-#@@ -0,0 1,295 @@
-#"""Gurobi MILP for drop allocation with full size-runs.
-#
-#This version follows the latest stakeholder specification, which requires the
-#model to:
-
-#* use door tiers and SKU heat to look up both the objective score and the
-#  per-door/SKU ``max_runs`` cap,
-#* enforce supply at the SKU×size level using size-curve ratios,
-#* enforce an anti-concentration cap per door tier, and
-#* convert full runs to shipped units using the provided ``ratio`` per
-#  SKU×size in the exported allocation table.
-#The module maximizes the tier/heat score while respecting eligibility, supply,
-#and tier capacity constraints, then emits a stakeholder-friendly table of runs
-#and units.
-#"""
+"""Gurobi MILP for drop allocation with full size-runs.
+
+This version follows the latest stakeholder specification, which requires the
+model to:
+
+* use door tiers and SKU heat to look up both the objective score and the
+  per-door/SKU ``max_runs`` cap,
+* enforce supply at the SKU×size level using size-curve ratios,
+* enforce an anti-concentration cap per door tier, and
+* convert full runs to shipped units using the provided ``ratio`` per
+  SKU×size in the exported allocation table.
+
+The module maximizes the tier/heat score while respecting eligibility, supply,
+and tier capacity constraints, then emits a stakeholder-friendly table of runs
+and units.
+"""
 from __future__ import annotations
 
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Dict, List, Mapping, Sequence, Tuple, TYPE_CHECKING
+from functools import cached_property
+from typing import Dict, Iterator, List, Mapping, Sequence, Tuple, TYPE_CHECKING
 
 import gurobipy as gp
+import numpy as np
+import scipy.sparse as sp
 from gurobipy import GRB
 
 if TYPE_CHECKING:  # pragma: no cover - for static type checking only
@@ -35,6 +34,20 @@ Door = str
 SKU = str
 Size = str
 
+#: Gurobi parameters applied to every new model; ``optimize(**kwargs)`` overrides them.
+#: Presolve=1 avoids the occasional blow-up of aggressive presolve on this MILP,
+#: Symmetry=2 targets interchangeable doors within a tier, and MIPFocus=1 favours
+#: finding good allocations quickly over proving optimality.
+DEFAULT_SOLVER_PARAMS: Dict[str, object] = {
+    "Presolve": 1,
+    "Symmetry": 2,
+    "MIPFocus": 1,
+}
+
+#: Number of structurally distinct models kept by ``build_allocation_model(reuse_model=True)``.
+MODEL_CACHE_SIZE = 8
+_MODEL_CACHE: "OrderedDict[tuple, Tuple[AllocationModel, gp.MConstr, gp.MConstr]]" = OrderedDict()
+
 
 @dataclass(frozen=True)
 class AllocationData:
@@ -68,151 +81,585 @@ class AllocationData:
     ratio: Mapping[Tuple[SKU, Size], float]
     cap_runs_total: Mapping[str, float]
 
+    @cached_property
+    def arrays(self) -> "AllocationArrays":
+        """Dense, integer-indexed view of the inputs, built on first access.
+
+        The view is cached, so treat the mappings as read-only once the data
+        has been handed to :func:`build_allocation_model`.
+        """
+        return AllocationArrays.from_data(self)
+
+
+@dataclass(frozen=True)
+class AllocationArrays:
+    """Inputs as NumPy arrays indexed by door/SKU position.
+
+    Row ``i`` refers to ``data.doors[i]`` and column ``j`` to ``data.skus[j]``;
+    supply arrays follow the order of ``supply_keys``.
+
+    Attributes:
+        score: ``Score[tier(d), heat(s)]`` as a ``(|D|, |S|)`` array.
+        eligible_cap: ``floor(Eligible[d, s] * MaxRuns[tier(d), heat(s)])`` as a ``(|D|, |S|)`` array.
+        door_caps: ``floor(CapRunsTotal[tier(d)])`` per door, ``GRB.INFINITY`` when uncapped.
+        tier_codes: Integer tier code per door (first-seen order).
+        supply_keys: SKU×size key of each supply row.
+        supply_sku: SKU column index of each supply row.
+        supply_ratio: ``ratio[s, z]`` of each supply row.
+        supply_units: ``Supply[s, z]`` of each supply row.
+    """
+
+    score: np.ndarray
+    eligible_cap: np.ndarray
+    door_caps: np.ndarray
+    tier_codes: np.ndarray
+    supply_keys: List[Tuple[SKU, Size]]
+    supply_sku: np.ndarray
+    supply_ratio: np.ndarray
+    supply_units: np.ndarray
+
+    @classmethod
+    def from_data(cls, data: AllocationData) -> "AllocationArrays":
+        """Build the arrays from the mapping-based :class:`AllocationData`.
+
+        Tiers and heats are factorized to integer codes so the ``(tier, heat)``
+        tables are read once into small ``(|T|, |H|)`` arrays and broadcast to
+        doors and SKUs by fancy indexing, instead of hashing a string tuple per
+        door/SKU cell.
+        """
+        n_doors, n_skus = len(data.doors), len(data.skus)
+        tier_levels, tier_codes = _factorize([data.door_tier[door] for door in data.doors])
+        heat_levels, heat_codes = _factorize([data.heat[sku] for sku in data.skus])
+
+        score_table = np.array(
+            [[data.score[(tier, heat)] for heat in heat_levels] for tier in tier_levels],
+            dtype=float,
+        ).reshape(len(tier_levels), len(heat_levels))
+        max_runs_table = np.array(
+            [[data.max_runs[(tier, heat)] for heat in heat_levels] for tier in tier_levels],
+            dtype=float,
+        ).reshape(len(tier_levels), len(heat_levels))
+        cells = np.ix_(tier_codes, heat_codes)
+
+        door_index = {door: i for i, door in enumerate(data.doors)}
+        sku_index = {sku: j for j, sku in enumerate(data.skus)}
+        eligible_arr = np.zeros((n_doors, n_skus), dtype=float)
+        for (door, sku), flag in data.eligible.items():
+            i = door_index.get(door)
+            j = sku_index.get(sku)
+            if i is not None and j is not None:
+                eligible_arr[i, j] = flag
+
+        # CapRunsTotal is looked up once per tier and broadcast to doors by tier code.
+        tier_caps = np.array(
+            [data.cap_runs_total.get(tier, GRB.INFINITY) for tier in tier_levels],
+            dtype=float,
+        )
+        tier_caps = np.where(tier_caps < GRB.INFINITY, np.floor(tier_caps), GRB.INFINITY)
+
+        supply_keys = list(data.supply_units)
+        return cls(
+            score=score_table[cells],
+            eligible_cap=np.floor(eligible_arr * max_runs_table[cells]),
+            door_caps=tier_caps[tier_codes],
+            tier_codes=tier_codes,
+            supply_keys=supply_keys,
+            supply_sku=np.array([sku_index[sku] for sku, _ in supply_keys], dtype=np.int64),
+            supply_ratio=np.array([data.ratio[key] for key in supply_keys], dtype=float),
+            supply_units=np.array([data.supply_units[key] for key in supply_keys], dtype=float),
+        )
+
 
 class AllocationModel:
-    """Wrapper around the MILP and its primary variables."""
+    """Wrapper around the MILP and its primary variables.
 
-    def __init__(self, model: gp.Model, runs: gp.tupledict, data: AllocationData):
+    ``runs`` holds one row of variables per door class (doors sharing a tier
+    and an identical eligibility cap row); ``door_class[i]`` is the class of
+    ``data.doors[i]``. Use :meth:`door_runs` for per-door quantities.
+    """
+
+    def __init__(
+        self,
+        model: gp.Model,
+        runs: gp.MVar,
+        data: AllocationData,
+        door_class: np.ndarray,
+        supply_keys: Sequence[Tuple[SKU, Size]],
+        capped_classes: np.ndarray,
+    ):
         self.model = model
         self.runs = runs
         self.data = data
+        self.door_class = door_class
+        self.supply_keys = list(supply_keys)
+        self.capped_classes = capped_classes
+        self.class_sizes = np.bincount(door_class, minlength=runs.shape[0])
+        # Position of each door within its class, used to deal class runs out to doors.
+        self.door_rank = np.zeros(len(door_class), dtype=np.int64)
+        seen = np.zeros(runs.shape[0], dtype=np.int64)
+        for i, cls in enumerate(door_class):
+            self.door_rank[i] = seen[cls]
+            seen[cls] += 1
+        _apply_default_params(self.model)
+
+    def optimize(self, warm_start: bool = True, **kwargs) -> int:
+        """Optimize the model and return the Gurobi status code.
 
-    def optimize(self, **kwargs) -> int:
-        """Optimize the model and return the Gurobi status code."""
+        Args:
+            warm_start: When a previous ``optimize`` call left an incumbent, pass
+                it to Gurobi as the MIP start so "what-if" re-solves begin from
+                the last allocation. The model topology (doors, SKUs, sizes) must
+                be unchanged; bounds, right-hand sides, and parameters may differ.
+            **kwargs: Gurobi parameters applied before solving.
+        """
         for param, value in kwargs.items():
             self.model.setParam(param, value)
+        if warm_start and self.model.SolCount > 0:
+            self.runs.Start = self.runs.X
         self.model.optimize()
         return self.model.Status
 
-    def summarize_allocations(self, tolerance: float = 1e-6) -> List[Dict[str, object]]:
+    def seed_from_greedy(self, num_starts: int = 1, seed: int = 0) -> np.ndarray:
+        """Load greedy feasible allocations as MIP starts.
+
+        SKUs are taken in descending order of their best score and each is
+        poured into its eligible doors from the highest score down, respecting
+        ``MaxRuns``, remaining supply, and each door's ``CapRunsTotal``. The
+        starts are only hints; they do not change what the solver can prove.
+
+        Args:
+            num_starts: Number of starts to load (``NumStart``). The first is
+                the plain greedy fill; the others randomize the SKU and door
+                orderings to give Gurobi diverse incumbents.
+            seed: Seed for the randomized orderings.
+
+        Returns:
+            The deterministic greedy per-door ``(|D|, |S|)`` runs (start 0).
+        """
+        self.model.NumStart = num_starts
+        rng = np.random.default_rng(seed)
+        first = None
+        for k in range(num_starts):
+            door_start = _greedy_runs(self.data, rng if k else None)
+            class_start = np.zeros(self.runs.shape)
+            np.add.at(class_start, self.door_class, door_start)
+            self.model.Params.StartNumber = k
+            self.runs.Start = class_start
+            if first is None:
+                first = door_start
+        self.model.Params.StartNumber = 0
+        return first
+
+    def seed_from_door_runs(self, door_runs: Mapping[Tuple[Door, SKU], float]) -> int:
+        """Load per-door runs, keyed by door and SKU, as the MIP start.
+
+        The start is summed into door classes here, so runs saved from a model
+        with different inputs still land on the right variables. Entries naming
+        doors or SKUs that are no longer in the data are ignored.
+
+        Returns:
+            Number of entries that matched a door/SKU of this model.
+        """
+        door_index = {door: i for i, door in enumerate(self.data.doors)}
+        sku_index = {sku: j for j, sku in enumerate(self.data.skus)}
+        door_start = np.zeros((len(door_index), len(sku_index)))
+        matched = 0
+        for (door, sku), value in door_runs.items():
+            i = door_index.get(door)
+            j = sku_index.get(sku)
+            if i is not None and j is not None:
+                door_start[i, j] = value
+                matched += 1
+        class_start = np.zeros(self.runs.shape)
+        np.add.at(class_start, self.door_class, door_start)
+        self.runs.Start = class_start
+        return matched
+
+    def tune(self, time_limit: float = 60) -> int:
+        """Run Gurobi's parameter tuner and load the best parameter set found.
+
+        The tuned parameters stay on the model, so later :meth:`optimize` calls
+        reuse them.
+
+        Args:
+            time_limit: Tuning budget in seconds (``TuneTimeLimit``).
+
+        Returns:
+            Number of improved parameter sets found (``TuneResultCount``).
+        """
+        self.model.setParam("TuneTimeLimit", time_limit)
+        self.model.tune()
+        if self.model.TuneResultCount > 0:
+            self.model.getTuneResult(0)
+        return self.model.TuneResultCount
+
+    def door_runs(self, class_values: np.ndarray | None = None) -> np.ndarray:
+        """Disaggregate class-level runs into a ``(|D|, |S|)`` integer array.
+
+        Runs of each class are dealt out round-robin (McNaughton wrap-around):
+        the class's SKUs are laid end to end and unit ``p`` goes to the door of
+        rank ``p mod k``. Every door then receives at most ``ceil(runs / k)``
+        of each SKU and at most ``ceil(total / k)`` runs overall, so per-door
+        ``MaxRuns`` and ``CapRunsTotal`` hold whenever the class totals do.
+
+        Args:
+            class_values: Class-level run values; defaults to ``runs.X``.
+        """
+        if class_values is None:
+            class_values = self.runs.X
+        class_runs = np.rint(class_values).astype(np.int64)
+        starts = np.cumsum(class_runs, axis=1) - class_runs
+
+        k = self.class_sizes[self.door_class][:, np.newaxis]
+        rank = self.door_rank[:, np.newaxis]
+        start = starts[self.door_class]
+        end = start + class_runs[self.door_class]
+        return (end - rank + k - 1) // k - (start - rank + k - 1) // k
+
+    def summarize_allocations(
+        self, tolerance: float = 1e-6, solution_number: int | None = None
+    ) -> "pd.DataFrame":
         """Return allocations in a stakeholder-friendly table.
 
         Args:
             tolerance: Minimum run quantity to include in the output.
+            solution_number: Pool solution to summarize (read via ``Xn``);
+                defaults to the incumbent.
 
         Returns:
-            List of dict rows with door, SKU, size, runs, ratio, score, and heat.
+            DataFrame with one row per door/SKU/size holding runs, ratio, units,
+            score, heat, and the door's total units for that size.
         """
+        import pandas as pd  # Local import to keep pandas optional
+
         if self.model.SolCount == 0:
             raise ValueError("Model has no solution to summarize.")
 
-        rows: List[Dict[str, object]] = []
-        units_by_door_size: Dict[Tuple[Door, Size], float] = {}
-
-        for door in self.data.doors:
-            for sku in self.data.skus:
-                value = self.runs[door, sku].X
-                if value <= tolerance:
-                    continue
-                heat = self.data.heat[sku]
-                tier = self.data.door_tier[door]
-                score = self.data.score[(tier, heat)]
-                for size in self.data.sku_sizes[sku]:
-                    ratio = self.data.ratio[(sku, size)]
-                    units = ratio * value
-                    units_by_door_size[(door, size)] = units_by_door_size.get((door, size), 0.0) + units
-                    rows.append(
-                        {
-                            "door": door,
-                            "sku": sku,
-                            "size": size,
-                            "runs": value,
-                            "ratio": ratio,
-                            "units": units,
-                            "score": score,
-                            "heat": heat,
-                        }
-                    )
-
-        for row in rows:
-            row["door_size_units"] = units_by_door_size[(row["door"], row["size"])]
-        return rows
-
-    def add_solution_pool(self) -> None:
-        """Enable solution pool to capture alternatives for stakeholder review."""
+        data = self.data
+        if solution_number is None:
+            values = self.door_runs()
+        else:
+            self.model.setParam("SolutionNumber", solution_number)
+            values = self.door_runs(self.runs.Xn)
+
+        # Columns are gathered with NumPy fancy indexing: one output row per
+        # allocated door/SKU pair and size, in door, SKU, size order.
+        door_idx, sku_idx = np.nonzero(values > tolerance)
+        size_counts = np.array([len(data.sku_sizes[sku]) for sku in data.skus], dtype=np.int64)
+        size_offsets = np.cumsum(size_counts) - size_counts
+        repeats = size_counts[sku_idx]
+        row_start = np.repeat(np.cumsum(repeats) - repeats, repeats)
+        size_pos = np.repeat(size_offsets[sku_idx], repeats) + np.arange(row_start.size) - row_start
+        door_idx = np.repeat(door_idx, repeats)
+        sku_idx = np.repeat(sku_idx, repeats)
+
+        flat_keys = [(sku, size) for sku in data.skus for size in data.sku_sizes[sku]]
+        ratio_flat = np.array([data.ratio[key] for key in flat_keys])
+        heat_of = np.array([data.heat[sku] for sku in data.skus], dtype=object)
+
+        runs_col = values[door_idx, sku_idx]
+        ratio_col = ratio_flat[size_pos]
+        table = pd.DataFrame(
+            {
+                "door": np.array(data.doors, dtype=object)[door_idx],
+                "sku": np.array(data.skus, dtype=object)[sku_idx],
+                "size": np.array([size for _, size in flat_keys], dtype=object)[size_pos],
+                "runs": runs_col,
+                "ratio": ratio_col,
+                "units": ratio_col * runs_col,
+                "score": data.arrays.score[door_idx, sku_idx],
+                "heat": heat_of[sku_idx],
+            }
+        )
+        table["door_size_units"] = table.groupby(["door", "size"])["units"].transform("sum")
+        return table
+
+    def allocation_records(self, tolerance: float = 1e-6) -> List[Dict[str, object]]:
+        """Return :meth:`summarize_allocations` as a list of dict rows."""
+        return self.summarize_allocations(tolerance).to_dict("records")
+
+    def add_solution_pool(self, solutions: int = 10, gap: float = 0.1) -> None:
+        """Enable solution pool to capture alternatives for stakeholder review.
+
+        The parameters are set on the model right away, so the alternatives are
+        collected during the next :meth:`optimize` call rather than a second run,
+        and later ``setParam`` calls on ``model`` still take precedence.
+
+        Args:
+            solutions: Number of allocations to keep (``PoolSolutions``).
+            gap: Relative gap to the best allocation within which alternatives
+                are kept (``PoolGap``).
+        """
         self.model.setParam("PoolSearchMode", 2)
-        self.model.setParam("PoolSolutions", 10)
+        self.model.setParam("PoolSolutions", solutions)
+        self.model.setParam("PoolGap", gap)
 
-    def constraint_slacks(self) -> List[Dict[str, object]]:
-        """Expose constraint slacks to explain limiting factors."""
+    def enumerate_pool(self) -> Iterator[np.ndarray]:
+        """Yield per-door ``(|D|, |S|)`` runs for each pool solution, best first."""
         if self.model.SolCount == 0:
             raise ValueError("Model has no solution; optimize first.")
+        for k in range(self.model.SolCount):
+            self.model.setParam("SolutionNumber", k)
+            yield self.door_runs(self.runs.Xn)
+
+    def constraint_names(self) -> List[str]:
+        """Return descriptive row names in ``getConstrs()`` order.
+
+        Names for the builder's supply and tier-cap rows are generated on demand
+        from the stored row keys, so models built without ``debug_names`` still
+        report readable slacks. Rows added to ``model`` afterwards keep their own
+        ``ConstrName``.
+        """
+        class_first = np.unique(self.door_class, return_index=True)[1]
+        names = [f"supply[{sku},{size}]" for sku, size in self.supply_keys] + [
+            _class_label("cap_runs_total", self.data.doors[class_first[c]], self.class_sizes[c])
+            for c in self.capped_classes
+        ]
+        extra = self.model.getConstrs()[len(names):]
+        if extra:
+            names += self.model.getAttr("ConstrName", extra)
+        return names
+
+    def constraint_slacks(self) -> "pd.DataFrame":
+        """Expose constraint slacks to explain limiting factors.
+
+        Returns:
+            DataFrame with one row per constraint: ``name``, ``slack``, ``rhs``,
+            and ``sense``.
+        """
+        import pandas as pd  # Local import to keep pandas optional
+
+        if self.model.SolCount == 0:
+            raise ValueError("Model has no solution; optimize first.")
+
+        constrs = self.model.getConstrs()
+        return pd.DataFrame(
+            {
+                "name": self.constraint_names(),
+                "slack": self.model.getAttr("Slack", constrs),
+                "rhs": self.model.getAttr("RHS", constrs),
+                "sense": self.model.getAttr("Sense", constrs),
+            }
+        )
+
+
+def _greedy_runs(data: AllocationData, rng: np.random.Generator | None = None) -> np.ndarray:
+    """Build a feasible per-door ``(|D|, |S|)`` allocation by greedy filling.
+
+    With ``rng``, scores are jittered before ordering SKUs and doors so repeated
+    calls yield different (still feasible) allocations.
+    """
+    arrays = data.arrays
+    score_arr, eligible_cap = arrays.score, arrays.eligible_cap
+    n_doors, n_skus = eligible_cap.shape
+    if rng is not None:
+        score_arr = score_arr * rng.uniform(0.5, 1.0, size=score_arr.shape)
+
+    door_left = arrays.door_caps.copy()
+    supply_left: Dict[int, List[List[float]]] = {}
+    supply_rows = zip(arrays.supply_sku.tolist(), arrays.supply_units.tolist(), arrays.supply_ratio.tolist())
+    for j, supply, ratio in supply_rows:
+        supply_left.setdefault(j, []).append([supply, ratio])
+
+    runs = np.zeros((n_doors, n_skus))
+    best_score = score_arr.max(axis=0) if n_doors else np.zeros(n_skus)
+    for j in np.argsort(-best_score, kind="stable"):
+        sizes = supply_left.get(j, [])
+        available = min((left // ratio for left, ratio in sizes if ratio > 0), default=np.inf)
+        if available <= 0:
+            continue
+        order = np.argsort(-score_arr[:, j], kind="stable")
+        caps = np.maximum(np.minimum(eligible_cap[order, j], door_left[order]), 0)
+        before = np.cumsum(caps) - caps
+        take = np.clip(available - before, 0, caps)
+        runs[order, j] = take
+        door_left[order] -= take
+        total = take.sum()
+        for entry in sizes:
+            entry[0] -= entry[1] * total
+    return runs
+
+
+def _factorize(values: Sequence[str]) -> Tuple[List[str], np.ndarray]:
+    """Return the distinct values (first-seen order) and an integer code per value."""
+    index: Dict[str, int] = {}
+    codes = np.fromiter(
+        (index.setdefault(value, len(index)) for value in values),
+        dtype=np.int64,
+        count=len(values),
+    )
+    return list(index), codes
 
-        rows: List[Dict[str, object]] = []
-        for constr in self.model.getConstrs():
-            rows.append(
-                {
-                    "name": constr.ConstrName,
-                    "slack": constr.Slack,
-                    "rhs": constr.RHS,
-                    "sense": constr.Sense,
-                }
-            )
-        return rows
-
-def build_allocation_model(data: AllocationData, model_name: str = "full_run_allocation") -> AllocationModel:
+
+def build_allocation_model(
+    data: AllocationData,
+    model_name: str = "full_run_allocation",
+    debug_names: bool = False,
+    reuse_model: bool = False,
+) -> AllocationModel:
     """Construct the MILP defined in the tier/heat specification.
 
+    The model is assembled with Gurobi's matrix API so that variables, the
+    objective, and each constraint family are handed to Gurobi as NumPy/SciPy
+    arrays instead of being emitted term by term from Python.
+
+    Doors that share a tier and an identical eligibility cap row are
+    interchangeable (same score, same caps), so they are aggregated into door
+    classes ``c`` with ``|c|`` doors. This removes the permutation symmetry
+    between such doors from branch-and-bound; :meth:`AllocationModel.door_runs`
+    maps class runs back to doors without loss.
+
     Components:
-    * Decision variables ``runs[d, s]``: integer full runs of SKU ``s`` to door ``d``.
-    * Objective: maximize ``sum runs[d, s] * Score[tier(d), heat(s)]``.
+    * Decision variables ``runs[c, s]``: integer full runs of SKU ``s`` to the doors of
+      class ``c``, held in a ``(|C|, |S|)`` :class:`gurobipy.MVar`.
+    * Objective: maximize ``sum runs[c, s] * Score[tier(c), heat(s)]``.
     * Constraints:
-        1. Eligibility  cap: ``runs[d, s] <= Eligible[d, s] * MaxRuns[tier(d), heat(s)]``.
-        2. Supply: ``sum_d ratio[s, z] * runs[d, s] <= Supply[s, z]`` for each SKU×size.
-        3. Anti-concentration: ``sum_s runs[d, s] <= CapRunsTotal[tier(d)]``.
+        1. Eligibility  cap: ``runs[c, s] <= |c| * Eligible[c, s] * MaxRuns[tier(c), heat(s)]``,
+           expressed as the variable upper bound.
+        2. Supply: ``sum_c ratio[s, z] * runs[c, s] <= Supply[s, z]`` for each SKU×size.
+        3. Anti-concentration: ``sum_s runs[c, s] <= |c| * CapRunsTotal[tier(c)]``.
         4. Integrality and non-negativity: runs are integer full runs.
+
+    Constraint rows are left with Gurobi's default names unless ``debug_names``
+    is set (useful when writing LP files); :meth:`AllocationModel.constraint_slacks`
+    generates descriptive names on demand either way.
+
+    With ``reuse_model=True`` the built model is cached under its structure
+    (doors, SKUs, supply rows and ratios, door classes, capped classes). A later
+    call with the same structure updates bounds, objective coefficients, and
+    right-hand sides of the cached model in place, and returns the same
+    :class:`AllocationModel` with its last incumbent loaded as the MIP start and
+    its parameters reset to :data:`DEFAULT_SOLVER_PARAMS`. It does not rebuild
+    the model. Callers holding that object see the new data. Cached models stay
+    alive until evicted or released with :func:`clear_model_cache`.
     """
 
+    arrays = data.arrays
+    n_skus = len(data.skus)
+
+    # Doors with the same tier and the same eligibility caps are interchangeable, so
+    # each such class gets one row of aggregate variables instead of one per door.
+    door_class, class_first = _door_classes(arrays)
+    class_sizes = np.bincount(door_class)
+    n_classes = len(class_first)
+    class_score = arrays.score[class_first]
+    class_cap = arrays.eligible_cap[class_first] * class_sizes[:, np.newaxis]
+
+    # Anti-concentration per door class: |class| · floor(cap) bounds the class total, which
+    # the round-robin split in door_runs turns back into at most floor(cap) per door.
+    # Classes whose tier has no finite cap get no row rather than an infinite right-hand side.
+    class_caps = arrays.door_caps[class_first]
+    capped = np.flatnonzero(class_caps < GRB.INFINITY)
+    cap_vec = class_caps[capped] * class_sizes[capped]
+
+    cache_key = None
+    if reuse_model:
+        cache_key = (
+            model_name,
+            debug_names,
+            tuple(data.doors),
+            tuple(data.skus),
+            tuple(arrays.supply_keys),
+            arrays.supply_ratio.tobytes(),
+            door_class.tobytes(),
+            capped.tobytes(),
+        )
+        cached = _MODEL_CACHE.get(cache_key)
+        if cached is not None:
+            _MODEL_CACHE.move_to_end(cache_key)
+            allocation, supply_constrs, cap_constrs = cached
+            # Keep the last incumbent as a MIP start; the changes below discard the solution.
+            if allocation.model.SolCount > 0:
+                allocation.runs.Start = allocation.runs.X
+            allocation.runs.UB = class_cap
+            allocation.runs.Obj = class_score
+            supply_constrs.RHS = arrays.supply_units
+            cap_constrs.RHS = cap_vec
+            allocation.data = data
+            # Parameters from earlier optimize(**kwargs), tune(), or pool calls do not carry over.
+            allocation.model.resetParams()
+            _apply_default_params(allocation.model)
+            allocation.model.update()
+            return allocation
+
     model = gp.Model(model_name)
 
-    runs = model.addVars(
-        list(data.doors),
-        list(data.skus),
-        name="runs",
-        vtype=GRB.INTEGER,
-        lb=0,
+    # Eligibility and per-door per-SKU cap live on the variable upper bound; the objective
+    # is the variables' Obj coefficients, so no objective expression is built in Python.
+    runs = model.addMVar(
+        (n_classes, n_skus), vtype=GRB.INTEGER, lb=0, ub=class_cap, obj=class_score, name="runs"
     )
-
-    # Objective
-    model.setObjective(
-        gp.quicksum(
-            runs[door, sku]
-            * data.score[(data.door_tier[door], data.heat[sku])]
-            for door in data.doors
-            for sku in data.skus
-        ),
-        GRB.MAXIMIZE,
+    runs_flat = runs.reshape(-1)
+    model.ModelSense = GRB.MAXIMIZE
+
+    # Supply feasibility per SKU×size using fixed ratios; column c·|S| + s is runs[c, s]
+    n_supply = len(arrays.supply_keys)
+    rows = np.repeat(np.arange(n_supply), n_classes)
+    cols = (np.arange(n_classes)[np.newaxis, :] * n_skus + arrays.supply_sku[:, np.newaxis]).ravel()
+    coeffs = np.repeat(arrays.supply_ratio, n_classes)
+    supply_matrix = sp.csr_matrix((coeffs, (rows, cols)), shape=(n_supply, n_classes * n_skus))
+    supply_constrs = model.addMConstr(supply_matrix, runs_flat, GRB.LESS_EQUAL, arrays.supply_units)
+
+    cap_matrix = sp.kron(sp.identity(n_classes, format="csr")[capped], np.ones((1, n_skus)), format="csr")
+    cap_constrs = model.addMConstr(cap_matrix, runs_flat, GRB.LESS_EQUAL, cap_vec)
+
+    allocation = AllocationModel(
+        model=model,
+        runs=runs,
+        data=data,
+        door_class=door_class,
+        supply_keys=arrays.supply_keys,
+        capped_classes=capped,
     )
+    model.update()
+    if debug_names:
+        model.setAttr("ConstrName", model.getConstrs(), allocation.constraint_names())
+        model.update()
 
-    # Eligibility and per-door per-SKU cap
-    for door in data.doors:
-        for sku in data.skus:
-            tier = data.door_tier[door]
-            heat = data.heat[sku]
-            cap = data.eligible.get((door, sku), 0) * data.max_runs[(tier, heat)]
-            model.addConstr(
-                runs[door, sku] <= cap,
-                name=f"eligibility[{door},{sku}]",
-            )
-
-    # Supply feasibility per SKU×size using fixed ratios
-    for (sku, size), supply in data.supply_units.items():
-        ratio = data.ratio[(sku, size)]
-        model.addConstr(
-            gp.quicksum(ratio * runs[door, sku] for door in data.doors) <= supply,
-            name=f"supply[{sku},{size}]",
-        )
+    if cache_key is not None:
+        _MODEL_CACHE[cache_key] = (allocation, supply_constrs, cap_constrs)
+        while len(_MODEL_CACHE) > MODEL_CACHE_SIZE:
+            _MODEL_CACHE.popitem(last=False)
+    return allocation
 
-    # Anti-concentration per door/size
-    for door in data.doors:
-        model.addConstr(
-            gp.quicksum(runs[door, sku] for sku in data.skus)
-            <= data.cap_runs_total.get(data.door_tier[door], GRB.INFINITY),
-            name=f"cap_runs_total[{door}]",
-        )
 
-    model.update()
-    return AllocationModel(model=model, runs=runs, data=data)
+def clear_model_cache() -> None:
+    """Dispose of every model cached by ``build_allocation_model(reuse_model=True)``.
+
+    Cached :class:`AllocationModel` objects can no longer be optimized afterwards.
+    """
+    while _MODEL_CACHE:
+        _, (allocation, _, _) = _MODEL_CACHE.popitem()
+        allocation.model.dispose()
+
+
+def _apply_default_params(model: gp.Model) -> None:
+    """Set :data:`DEFAULT_SOLVER_PARAMS` on ``model``."""
+    for param, value in DEFAULT_SOLVER_PARAMS.items():
+        model.setParam(param, value)
+
+
+def _door_classes(arrays: AllocationArrays) -> Tuple[np.ndarray, np.ndarray]:
+    """Group doors that share a tier and an identical ``Eligible × MaxRuns`` row.
+
+    Returns:
+        ``door_class`` (class index per door, numbered by first appearance) and
+        ``class_first`` (index of the first door in each class).
+    """
+    class_index: Dict[Tuple[int, bytes], int] = {}
+    door_class = np.empty(len(arrays.tier_codes), dtype=np.int64)
+    for i, tier_code in enumerate(arrays.tier_codes.tolist()):
+        key = (tier_code, arrays.eligible_cap[i].tobytes())
+        door_class[i] = class_index.setdefault(key, len(class_index))
+    class_first = np.unique(door_class, return_index=True)[1]
+    return door_class, class_first
+
+
+def _class_label(prefix: str, first_door: Door, size: int) -> str:
+    """Name a door-class row after its first door and the number of further doors."""
+    if size == 1:
+        return f"{prefix}[{first_door}]"
+    return f"{prefix}[{first_door}+{size - 1}]"
 
 
 def allocation_data_from_tables(
@@ -240,49 +687,51 @@ def allocation_data_from_tables(
     import pandas as pd  # Local import to keep pandas optional
 
     def _series_to_mapping(df: pd.DataFrame, key_cols: List[str], value_col: str):
-        return {tuple(row[k] for k in key_cols): row[value_col] for row in df.to_dict("records")}
+        return df.set_index(key_cols)[value_col].to_dict()
 
     doors_list = sorted(doors["door"].unique())
     skus = sorted(articles["sku"].unique())
     sizes = sorted(articles["size"].unique())
 
-    sku_sizes: Dict[SKU, List[Size]] = {}
-    for row in articles.to_dict("records"):
-        sku_sizes.setdefault(row["sku"], []).append(row["size"])
-    sku_sizes = {sku: sorted(set(sizes_for_sku)) for sku, sizes_for_sku in sku_sizes.items()}
+    sku_size_pairs = articles[["sku", "size"]].drop_duplicates().sort_values(["sku", "size"])
+    sku_sizes: Dict[SKU, List[Size]] = sku_size_pairs.groupby("sku", sort=True)["size"].agg(list).to_dict()
 
     door_tier_map = doors.set_index("door")["tier"].to_dict()
     eligible_map = _series_to_mapping(eligibility, ["door", "sku"], "eligible")
-    supply_units_map = _series_to_mapping(supply, ["sku", "size"], "supply_units")
-    ratio_map = _series_to_mapping(supply, ["sku", "size"], "ratio")
+    supply_by_key = supply.set_index(["sku", "size"])
+    supply_units_map = supply_by_key["supply_units"].to_dict()
+    ratio_map = supply_by_key["ratio"].to_dict()
     if isinstance(heat, Mapping):
         heat_map = {sku: str(value) for sku, value in heat.items()}
     else:
-        heat_map = heat.set_index("sku")["heat"].astype(str).to_dict()
-    max_runs_map = _series_to_mapping(tier_cap_runs, ["tier", "heat"], "max_runs")
-    score_map = _series_to_mapping(tier_cap_runs, ["tier", "heat"], "score")
+        heat_labels = heat.set_index("sku")["heat"]
+        blank_heat = heat_labels.index[heat_labels.isna()]
+        if len(blank_heat):
+            raise ValueError(f"Missing heat values for SKUs: {sorted(blank_heat)}")
+        # Labels are made str before categorizing, so 1 and "1" collapse to one
+        # category and SKUs share a single str object per label.
+        heat_map = heat_labels.astype(str).astype("category").to_dict()
+    tier_heat = tier_cap_runs.set_index(["tier", "heat"])
+    max_runs_map = tier_heat["max_runs"].to_dict()
+    score_map = tier_heat["score"].to_dict()
     cap_runs_total_map = tier_capacity.set_index("tier")["cap_runs_total"].to_dict()
 
     missing_heat = set(skus) - set(heat_map)
     if missing_heat:
         raise ValueError(f"Missing heat entries for SKUs: {sorted(missing_heat)}")
 
-    expected_size_keys = {(sku, size) for sku, sizes_for_sku in sku_sizes.items() for size in sizes_for_sku}
-    missing_supply = expected_size_keys - set(supply_units_map)
-    if missing_supply:
+    # Supply and ratio share the supply table's (sku, size) index, so one check covers both.
+    missing_supply = pd.MultiIndex.from_frame(sku_size_pairs).difference(supply_by_key.index)
+    if len(missing_supply):
         raise ValueError(f"Missing supply entries for SKU×size pairs: {sorted(missing_supply)}")
 
-    tiers = set(door_tier_map.values())
-    required_pairs = {(tier, heat_map[sku]) for sku in skus for tier in tiers}
-    missing_score = required_pairs - set(score_map)
-    missing_max_runs = required_pairs - set(max_runs_map)
-    if missing_score:
-        raise ValueError(f"Missing score entries for tier/heat pairs: {sorted(missing_score)}")
-    if missing_max_runs:
-        raise ValueError(f"Missing max_runs entries for tier/heat pairs: {sorted(missing_max_runs)}")
-
-    if set(supply_units_map) != set(ratio_map):
-        raise ValueError("Supply and ratio tables must share identical (sku, size) keys.")
+    # Score and max_runs share the tier_cap_runs index, so one check covers both.
+    tiers = doors["tier"].unique()
+    heats = pd.Series(skus, dtype=object).map(heat_map).unique()
+    required_pairs = pd.MultiIndex.from_product([tiers, heats])
+    missing_score = required_pairs.difference(tier_heat.index)
+    if len(missing_score):
+        raise ValueError(f"Missing score/max_runs entries for tier/heat pairs: {sorted(missing_score)}")
 
     return AllocationData(
         doors=doors_list,
@@ -1,82 +1,430 @@
-#diff --git a/run_allocation.py b/run_allocation.py
-#new file mode 100644
-#index 0000000000000000000000000000000000000000..47d35794faabeab300691173ae1e4da67ac01c84
-#--- /dev/null
-# b/run_allocation.py
-#@@ -0,0+1,108 @@
-#"""CLI for loading allocation data and writing stakeholder outputs.
-
-#his script keeps data ingestion and result export separate from the README so
-#you can run the optimizer directly from Excel tables.
-#"""
+"""CLI for loading allocation data and writing stakeholder outputs.
+
+This script keeps data ingestion and result export separate from the README so
+you can run the optimizer directly from CSV, Parquet, or Excel tables.
+"""
 from __future__ import annotations
 
 import argparse
+import glob
+import hashlib
+import logging
+import multiprocessing
+import os
+import pickle
+import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from logging.handlers import QueueHandler, QueueListener
+from multiprocessing import Pool
 from pathlib import Path
-from typing import Optional
+from typing import BinaryIO, Callable, Dict, Optional
 
 import gurobipy as gp
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+
+import allocation_model
+from allocation_model import AllocationData, AllocationModel, allocation_data_from_tables, build_allocation_model
 
-from allocation_model import allocation_data_from_tables, build_allocation_model
+# A fixed name rather than __name__, which is "__main__" when run as a script but
+# "run_allocation" in spawned scenario workers.
+logger = logging.getLogger("run_allocation")
 
 REPO_ROOT = Path(__file__).resolve().parent
 DEFAULT_DATA_DIR = REPO_ROOT / "data"
+#: Per-user directory for memoized ``AllocationData``. Kept out of the (often
+#: shared or synced) data directory because the memos are pickles.
+DATA_CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "hype_allocation"
+#: Bump when the memo layout changes so older pickles are ignored.
+DATA_CACHE_VERSION = 1
+#: Number of memoized datasets kept in ``DATA_CACHE_DIR``.
+DATA_CACHE_SIZE = 16
+
+
+#: Input tables, named after the ``allocation_data_from_tables`` keyword they feed.
+TABLE_NAMES = ("doors", "articles", "eligibility", "supply", "heat", "tier_cap_runs", "tier_capacity")
+#: File formats tried for each input table, fastest to parse first.
+TABLE_SUFFIXES = (".parquet", ".csv", ".xlsx")
+#: Bytes per block handed to each PyArrow CSV parser thread.
+CSV_BLOCK_SIZE = 64 << 20
+#: Bytes read per step when hashing an input file for the Feather cache key.
+HASH_CHUNK_SIZE = 1 << 20
+#: Slack at or below which a constraint counts as binding in the slack report.
+BINDING_TOLERANCE = 1e-6
+#: Output CSV compression codecs and the extension each appends to ``.csv``.
+CSV_COMPRESSION_SUFFIXES = {"none": "", "gzip": ".gz", "zstd": ".zst"}
+#: Column dtypes per input table, so readers skip type inference. Identifiers are
+#: strings and low-cardinality labels (tier, heat) are categoricals. Numbers are
+#: float64: the model takes fractional ratios and supply, and floors run caps itself.
+SCHEMAS: Dict[str, Dict[str, str]] = {
+    "doors": {"door": "str", "tier": "category"},
+    "articles": {"sku": "str", "size": "str"},
+    "eligibility": {"door": "str", "sku": "str", "eligible": "float64"},
+    "supply": {"sku": "str", "size": "str", "supply_units": "float64", "ratio": "float64"},
+    "heat": {"sku": "str", "heat": "category"},
+    "tier_cap_runs": {"tier": "category", "heat": "category", "max_runs": "float64", "score": "float64"},
+    "tier_capacity": {"tier": "category", "cap_runs_total": "float64"},
+}
+
+
+def _excel_engine() -> Optional[str]:
+    """Prefer the Rust-based calamine reader when it is installed."""
+    try:
+        import python_calamine  # noqa: F401
+    except ImportError:
+        return None
+    return "calamine"
+
+
+def _arrow_type(dtype: str) -> pa.DataType:
+    if dtype == "str":
+        return pa.string()
+    if dtype == "category":
+        return pa.dictionary(pa.int32(), pa.string())
+    return pa.from_numpy_dtype(dtype)
+
+
+def _write_atomically(path: Path, write: Callable[[Path], None]) -> None:
+    """Call ``write`` on a temp file next to ``path`` and rename it into place.
 
+    Readers, including other runs sharing the data directory, only ever see a
+    complete file, so an interrupted run cannot leave a truncated cache behind.
+    The file gets the umask's default mode rather than ``mkstemp``'s 0600, so
+    it stays readable to whoever could read a file written in place.
+    """
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    os.close(fd)
+    tmp_path = Path(tmp_name)
+    umask = os.umask(0)
+    os.umask(umask)
+    try:
+        write(tmp_path)
+        os.chmod(tmp_path, 0o666 & ~umask)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
 
-def _read_table(path: Path, *, required: bool = True) -> Optional[pd.DataFrame]:
-    if path.exists():
-        return pd.read_excel(path)
+
+def _read_path(path: Path, handle: BinaryIO) -> pd.DataFrame:
+    """Parse the table at ``path`` from its already-open ``handle``."""
+    schema = SCHEMAS.get(path.stem, {})
+    if path.suffix == ".parquet":
+        frame = pd.read_parquet(handle, engine="pyarrow")
+        return frame.astype({column: dtype for column, dtype in schema.items() if column in frame})
+
+    # CSV/Excel parses are cached as Feather next to the input, keyed by content hash
+    # (and the schema it was parsed with), so reruns on unchanged inputs skip parsing.
+    # The file is hashed in chunks, then rewound and parsed from the same handle
+    # on a cache miss, so its bytes are never held in memory all at once.
+    hasher = hashlib.blake2b(digest_size=8)
+    for chunk in iter(lambda: handle.read(HASH_CHUNK_SIZE), b""):
+        hasher.update(chunk)
+    hasher.update(repr(sorted(schema.items())).encode())
+    digest = hasher.hexdigest()
+    cache_path = path.with_suffix(f"{path.suffix}.{digest}.feather")
+    try:
+        return pd.read_feather(cache_path)
+    except Exception:
+        pass  # Missing or unreadable (e.g. truncated) cache: parse the input again.
+
+    handle.seek(0)
+    if path.suffix == ".csv":
+        # Arrow parses blocks on multiple threads and hands pandas one table,
+        # releasing each block as it is converted to keep peak memory low.
+        table = pa_csv.read_csv(
+            handle,
+            read_options=pa_csv.ReadOptions(block_size=CSV_BLOCK_SIZE),
+            convert_options=pa_csv.ConvertOptions(
+                column_types={column: _arrow_type(dtype) for column, dtype in schema.items()}
+            ),
+        )
+        frame = table.to_pandas(split_blocks=True, self_destruct=True)
+        del table
+    else:
+        frame = pd.read_excel(handle, engine=_excel_engine(), dtype=schema or None)
+    try:
+        _write_atomically(cache_path, frame.to_feather)
+    except Exception:
+        # Read-only data directory, or columns Arrow cannot store (e.g. a notes
+        # column mixing ints and strings): run without the cache.
+        return frame
+    # Caches for earlier versions of the input can never hit again.
+    for stale in path.parent.glob(f"{glob.escape(path.name)}.*.feather"):
+        if stale != cache_path:
+            stale.unlink(missing_ok=True)
+    return frame
+
+
+def _read_table(data_dir: Path, name: str, *, required: bool = True) -> Optional[pd.DataFrame]:
+    for suffix in TABLE_SUFFIXES:
+        path = data_dir / f"{name}{suffix}"
+        # Opening directly (rather than probing with exists()) costs one round-trip
+        # per candidate on network drives, and the handle is reused for parsing.
+        try:
+            handle = path.open("rb")
+        except FileNotFoundError:
+            continue
+        with handle:
+            return _read_path(path, handle)
     if required:
+        candidates = ", ".join(f"{name}{suffix}" for suffix in TABLE_SUFFIXES)
         raise FileNotFoundError(
-            f"Missing required input table: {path}. Place Excel files under the repository data directory (default: {DEFAULT_DATA_DIR})."
+            f"Missing required input table {name!r} in {data_dir} (looked for {candidates}). "
+            f"Place input tables under the repository data directory (default: {DEFAULT_DATA_DIR})."
         )
     return None
 
 
-def run(data_dir: Path, output_prefix: Path, use_solution_pool: bool) -> None:
+def _load_allocation_data(tables: Dict[str, pd.DataFrame]) -> AllocationData:
+    """Build :class:`AllocationData`, memoized on disk by a fingerprint of the input tables.
+
+    Reruns that only change solver settings load the pickled result instead of
+    redoing the pandas reshaping in ``allocation_data_from_tables``. The key also
+    covers ``allocation_model.py`` itself, so code changes never serve stale data.
+    """
+    hasher = hashlib.blake2b(digest_size=8)
+    hasher.update(DATA_CACHE_VERSION.to_bytes(4, "little"))
+    hasher.update(Path(allocation_model.__file__).read_bytes())
+    for name in TABLE_NAMES:
+        frame = tables[name]
+        hasher.update(repr((name, list(frame.columns), [str(dtype) for dtype in frame.dtypes])).encode())
+        hasher.update(pd.util.hash_pandas_object(frame, index=True).values.tobytes())
+    cache_path = DATA_CACHE_DIR / f"alloc_data_{hasher.hexdigest()}.pkl"
+    try:
+        with cache_path.open("rb") as handle:
+            return pickle.load(handle)
+    except Exception:
+        pass  # Missing or unreadable (e.g. truncated) memo: rebuild it.
+
+    data = allocation_data_from_tables(**tables)
+    try:
+        DATA_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+
+        def dump(path: Path) -> None:
+            with path.open("wb") as handle:
+                pickle.dump(data, handle, protocol=pickle.HIGHEST_PROTOCOL)
+
+        _write_atomically(cache_path, dump)
+        memos = sorted(DATA_CACHE_DIR.glob("alloc_data_*.pkl"), key=lambda path: path.stat().st_mtime)
+        for old in memos[:-DATA_CACHE_SIZE]:
+            old.unlink(missing_ok=True)
+    except OSError:
+        pass  # Unwritable cache directory: run without the memo.
+    return data
+
+
+def _save_start(allocation: AllocationModel, path: Path) -> None:
+    """Save the incumbent's nonzero per-door runs for ``--warm-from``."""
+    runs = allocation.door_runs()
+    door_idx, sku_idx = runs.nonzero()
+    start = pd.DataFrame(
+        {
+            "door": [allocation.data.doors[i] for i in door_idx],
+            "sku": [allocation.data.skus[j] for j in sku_idx],
+            "runs": runs[door_idx, sku_idx],
+        }
+    )
+    _write_csv(start, str(path))
+
+
+def _load_start(allocation: AllocationModel, path: Path) -> None:
+    try:
+        start = pd.read_csv(path, dtype={"door": str, "sku": str})
+    except FileNotFoundError:
+        logger.warning("No saved start at %s; solving without it.", path)
+        return
+    runs = start.set_index(["door", "sku"])["runs"].to_dict()
+    matched = allocation.seed_from_door_runs(runs)
+    if matched < len(runs):
+        logger.warning(
+            "Ignored %d of %d saved start entries whose door or SKU is not in the current data.",
+            len(runs) - matched,
+            len(runs),
+        )
+
+
+def _write_csv(frame: pd.DataFrame, path: str, compression: str = "none") -> None:
+    """Write ``frame`` with Arrow's multi-threaded CSV writer instead of pandas' Python formatter."""
+    table = pa.Table.from_pandas(frame, preserve_index=False)
+    if compression == "none":
+        pa_csv.write_csv(table, path)
+        return
+    with pa.CompressedOutputStream(path, compression) as stream:
+        pa_csv.write_csv(table, stream)
+
+
+def _read_tables(data_dir: Path) -> Dict[str, pd.DataFrame]:
+    """Read every input table concurrently; the reads share no data and are I/O/parse bound."""
+    with ThreadPoolExecutor(max_workers=len(TABLE_NAMES)) as executor:
+        frames = executor.map(lambda name: _read_table(data_dir, name), TABLE_NAMES)
+        return dict(zip(TABLE_NAMES, frames))
+
+
+def run(
+    data_dir: Path,
+    output_prefix: Path,
+    use_solution_pool: bool,
+    *,
+    tune_time_limit: Optional[float] = None,
+    threads: Optional[int] = None,
+    mip_gap: Optional[float] = None,
+    time_limit: Optional[float] = None,
+    greedy_starts: int = 1,
+    warm_from: Optional[Path] = None,
+    compression: str = "none",
+) -> None:
+    # Every input is read relative to data_dir, so "~/..." must be expanded here
+    # rather than silently resolving against the working directory.
+    data_dir = data_dir.expanduser()
+    output_prefix = output_prefix.expanduser()
     if not data_dir.exists():
         raise FileNotFoundError(
-            f"Data directory does not exist: {data_dir}. Place Excel inputs in the repository's data/ folder or point --data-dir to your tables."
+            f"Data directory does not exist: {data_dir}. Place input tables in the repository's data/ folder or point --data-dir to your tables."
         )
     if not data_dir.is_dir():
-        raise NotADirectoryError(f"{data_dir} is not a directory; provide a folder containing the Excel input tables.")
-
-    doors = _read_table(data_dir / "doors.xlsx")
-    articles = _read_table(data_dir / "articles.xlsx")
-    eligibility = _read_table(data_dir / "eligibility.xlsx")
-    supply = _read_table(data_dir / "supply.xlsx")
-    heat = _read_table(data_dir / "heat.xlsx")
-    tier_cap_runs = _read_table(data_dir / "tier_cap_runs.xlsx")
-    tier_capacity = _read_table(data_dir / "tier_capacity.xlsx")
-
-    data = allocation_data_from_tables(
-        doors=doors,
-        articles=articles,
-        eligibility=eligibility,
-        supply=supply,
-        heat=heat,
-        tier_cap_runs=tier_cap_runs,
-        tier_capacity=tier_capacity,
-    )
+        raise NotADirectoryError(f"{data_dir} is not a directory; provide a folder containing the input tables.")
+
+    data = _load_allocation_data(_read_tables(data_dir))
 
     allocation = build_allocation_model(data)
     if use_solution_pool:
         allocation.add_solution_pool()
+    if greedy_starts > 0:
+        allocation.seed_from_greedy(num_starts=greedy_starts)
+    if warm_from is not None:
+        # A previous run's solution replaces the first greedy start. It is keyed
+        # by door and SKU, so it maps onto this model even if door classes or
+        # SKU order changed since it was saved.
+        _load_start(allocation, Path(f"{warm_from.expanduser()}_start.csv"))
+
+    solver_params: Dict[str, float] = {}
+    if threads is not None:
+        solver_params["Threads"] = threads
+    if mip_gap is not None:
+        solver_params["MIPGap"] = mip_gap
+    if time_limit is not None:
+        solver_params["TimeLimit"] = time_limit
+
+    # Tuned parameters persist next to the outputs and are reused by later runs.
+    # The tuner runs under the same Threads/MIPGap/TimeLimit as the solve, and
+    # optimize() applies them again so they also win over a stored parameter file.
+    output_prefix.parent.mkdir(parents=True, exist_ok=True)
+    param_file = f"{output_prefix}.prm"
+    if tune_time_limit is not None:
+        for param, value in solver_params.items():
+            allocation.model.setParam(param, value)
+        allocation.tune(time_limit=tune_time_limit)
+        allocation.model.write(param_file)
+        logger.info("Wrote tuned solver parameters to %s", param_file)
+    elif Path(param_file).exists():
+        allocation.model.read(param_file)
 
-    status = allocation.optimize()
+    status = allocation.optimize(**solver_params)
     if status not in {gp.GRB.OPTIMAL, gp.GRB.INTERRUPTED, gp.GRB.TIME_LIMIT}:
         raise RuntimeError(f"Model did not solve successfully (status={status}).")
+    if allocation.model.SolCount > 0:
+        _save_start(allocation, Path(f"{output_prefix}_start.csv"))
 
-    allocation_rows = allocation.summarize_allocations()
-    slack_rows = allocation.constraint_slacks()
+    csv_ext = ".csv" + CSV_COMPRESSION_SUFFIXES[compression]
+    _write_csv(allocation.summarize_allocations(), f"{output_prefix}_allocations{csv_ext}", compression)
+    logger.info("Wrote allocations to %s_allocations%s", output_prefix, csv_ext)
+
+    # The slack report explains which supply or tier-cap rows limited the
+    # allocation. When no row binds (or there are none) there is nothing to
+    # explain, so no file is written and any report from an earlier run with the
+    # same prefix is removed rather than left looking current.
+    slacks_path = Path(f"{output_prefix}_slacks{csv_ext}")
+    slacks = allocation.constraint_slacks() if allocation.model.NumConstrs else None
+    if slacks is not None and (slacks["slack"].abs() <= BINDING_TOLERANCE).any():
+        _write_csv(slacks, str(slacks_path), compression)
+        logger.info("Wrote constraint slacks to %s", slacks_path)
+    else:
+        slacks_path.unlink(missing_ok=True)
+        logger.info("No supply or tier-cap constraint binds; no slack report written.")
+
+    # Alternatives left by an earlier run with the same prefix are removed for
+    # the same reason, unless this run overwrites them below.
+    alternatives = range(1, allocation.model.SolCount) if use_solution_pool else range(0)
+    alt_prefix = f"{output_prefix.name}_alt"
+    for stale in output_prefix.parent.glob(f"{glob.escape(alt_prefix)}*{glob.escape(csv_ext)}"):
+        k = stale.name[len(alt_prefix) : -len(csv_ext)]
+        if k.isdigit() and int(k) not in alternatives:
+            stale.unlink(missing_ok=True)
+
+    if use_solution_pool:
+        # Pool solution 0 is the incumbent written above; each alternative is
+        # summarized and written on its own so only one is held at a time.
+        for k in alternatives:
+            alternative = allocation.summarize_allocations(solution_number=k)
+            _write_csv(alternative, f"{output_prefix}_alt{k}{csv_ext}", compression)
+        if allocation.model.SolCount > 1:
+            logger.info(
+                "Wrote %d alternative allocations to %s_alt<k>%s", allocation.model.SolCount - 1, output_prefix, csv_ext
+            )
+
+
+def run_scenarios(
+    scenarios_dir: Path,
+    output_prefix: Path,
+    use_solution_pool: bool,
+    *,
+    jobs: Optional[int] = None,
+    threads: Optional[int] = None,
+    log_queue: Optional["multiprocessing.Queue"] = None,
+    warm_from: Optional[Path] = None,
+    **options,
+) -> None:
+    """Solve every subdirectory of ``scenarios_dir`` as an independent dataset.
+
+    Scenarios run in ``jobs`` worker processes (default: one per scenario, up to
+    the core count) and split the cores between them, since several MIPs with a
+    few threads each finish a sweep sooner than one MIP at a time with all of
+    them. Outputs for scenario ``name`` go to ``<output_prefix.parent>/name/``,
+    and ``warm_from`` is resolved the same way (``<warm_from.parent>/name/``), so
+    each scenario warm-starts from its own previous run. Workers send their log
+    records to ``log_queue`` when one is given.
+    """
+    scenarios_dir = scenarios_dir.expanduser()
+    scenarios = sorted(path for path in scenarios_dir.iterdir() if path.is_dir() and not path.name.startswith("."))
+    if not scenarios:
+        raise FileNotFoundError(f"No scenario directories found in {scenarios_dir}.")
+    cores = os.cpu_count() or 1
+    jobs = max(1, min(jobs or cores, len(scenarios)))
+    if threads is None:
+        threads = max(1, cores // jobs)
+
+    tasks = [
+        dict(
+            options,
+            data_dir=scenario,
+            output_prefix=output_prefix.parent / scenario.name / output_prefix.name,
+            use_solution_pool=use_solution_pool,
+            threads=threads,
+            warm_from=None if warm_from is None else warm_from.parent / scenario.name / warm_from.name,
+        )
+        for scenario in scenarios
+    ]
+    pool_options = {"initializer": _configure_logging, "initargs": (log_queue,)} if log_queue is not None else {}
+    with Pool(processes=jobs, **pool_options) as pool:
+        pool.map(_run_scenario, tasks)
 
-    output_prefix.parent.mkdir(parents=True, exist_ok=True)
-    pd.DataFrame(allocation_rows).to_csv(f"{output_prefix}_allocations.csv", index=False)
-    pd.DataFrame(slack_rows).to_csv(f"{output_prefix}_slacks.csv", index=False)
 
-    print(f"Wrote allocations to {output_prefix}_allocations.csv")
-    print(f"Wrote constraint slacks to {output_prefix}_slacks.csv")
+def _run_scenario(task: Dict[str, object]) -> None:
+    run(**task)
+
+
+def _configure_logging(log_queue: "multiprocessing.Queue") -> None:
+    """Send this worker's progress messages to the parent through ``log_queue``.
+
+    Only this module's logger is touched; gurobipy's records keep going wherever
+    the worker's root logger sends them.
+    """
+    logger.handlers[:] = [QueueHandler(log_queue)]
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
 
 
 def parse_args() -> argparse.Namespace:
@@ -86,7 +434,8 @@ def parse_args() -> argparse.Namespace:
         type=Path,
         default=DEFAULT_DATA_DIR,
         help=(
-            "Directory containing Excel inputs (doors, articles, eligibility, supply, heat, tier_cap_runs, tier_capacity). "
+            "Directory containing input tables (doors, articles, eligibility, supply, heat, tier_cap_runs, tier_capacity) "
+            "as .parquet, .csv, or .xlsx; the first format found per table is used. "
             "Defaults to the repository's bundled data directory."
         ),
     )
@@ -101,12 +450,99 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Enable Gurobi solution pool to capture alternative allocations.",
     )
+    parser.add_argument(
+        "--tune",
+        type=float,
+        nargs="?",
+        const=60.0,
+        default=None,
+        metavar="SECONDS",
+        help=(
+            "Run Gurobi's parameter tuner (default budget: 60 seconds) and save the result to "
+            "<output-prefix>.prm, which later runs load automatically."
+        ),
+    )
+    parser.add_argument("--threads", type=int, default=None, help="Gurobi Threads parameter (default: all cores).")
+    parser.add_argument("--mip-gap", type=float, default=None, help="Relative MIP gap at which to stop (MIPGap).")
+    parser.add_argument("--time-limit", type=float, default=None, help="Solve time limit in seconds (TimeLimit).")
+    parser.add_argument(
+        "--greedy-starts",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Number of greedy MIP starts to seed the solver with; extra starts use randomized orderings (0 disables).",
+    )
+    parser.add_argument(
+        "--warm-from",
+        type=Path,
+        default=None,
+        metavar="PREFIX",
+        help="Output prefix of a previous run whose solution (<PREFIX>_start.csv) is used as the MIP start.",
+    )
+    parser.add_argument(
+        "--compression",
+        choices=sorted(CSV_COMPRESSION_SUFFIXES),
+        default="none",
+        help="Compress output CSVs (written as .csv.gz or .csv.zst). Defaults to plain CSV.",
+    )
+    parser.add_argument(
+        "--scenarios",
+        type=Path,
+        default=None,
+        metavar="DIR",
+        help=(
+            "Solve each subdirectory of DIR as a separate dataset in parallel processes instead of --data-dir; "
+            "outputs go to <output-prefix parent>/<scenario>/."
+        ),
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help=(
+            "Number of scenarios solved at once with --scenarios (default: one per scenario, up to the core count); "
+            "cores are split between them."
+        ),
+    )
     return parser.parse_args()
 
 
 def main() -> None:
     args = parse_args()
-    run(args.data_dir, args.output_prefix, args.solution_pool)
+    # Progress messages stay on stdout, next to Gurobi's own log.
+    console = logging.StreamHandler(sys.stdout)
+    logger.addHandler(console)
+    logger.setLevel(logging.INFO)
+
+    options = dict(
+        tune_time_limit=args.tune,
+        mip_gap=args.mip_gap,
+        time_limit=args.time_limit,
+        greedy_starts=args.greedy_starts,
+        warm_from=args.warm_from,
+        compression=args.compression,
+    )
+    if args.scenarios is None:
+        run(args.data_dir, args.output_prefix, args.solution_pool, threads=args.threads, **options)
+        return
+
+    # Scenario workers are separate processes; they hand their records to this
+    # process through a queue so messages from parallel solves are not interleaved.
+    log_queue = multiprocessing.Queue()
+    listener = QueueListener(log_queue, console)
+    listener.start()
+    try:
+        run_scenarios(
+            args.scenarios,
+            args.output_prefix,
+            args.solution_pool,
+            jobs=args.jobs,
+            threads=args.threads,
+            log_queue=log_queue,
+            **options,
+        )
+    finally:
+        listener.stop()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,224 @@
+import dataclasses
+import random
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from allocation_model import (
+    DEFAULT_SOLVER_PARAMS,
+    AllocationData,
+    _greedy_runs,
+    build_allocation_model,
+    clear_model_cache,
+)
+
+
+def _random_data(seed: int = 0, n_doors: int = 24, n_skus: int = 12, dense: bool = False) -> AllocationData:
+    """Small random instance; ``dense`` makes every door eligible so door classes get large."""
+    rng = random.Random(seed)
+    doors = [f"D{i:02d}" for i in range(n_doors)]
+    skus = [f"S{j:02d}" for j in range(n_skus)]
+    sizes = ["XS", "S", "M", "L"]
+    tiers = ["A", "B", "C"]
+    heats = ["Hype", "Medium", "Normal"]
+    sku_sizes = {sku: sorted(rng.sample(sizes, rng.randint(2, 4))) for sku in skus}
+    return AllocationData(
+        doors=doors,
+        sizes=sizes,
+        skus=skus,
+        door_tier={door: rng.choice(tiers) for door in doors},
+        sku_sizes=sku_sizes,
+        eligible={(door, sku): int(dense or rng.random() < 0.7) for door in doors for sku in skus},
+        heat={sku: rng.choice(heats) for sku in skus},
+        score={(tier, heat): rng.randint(10, 100) for tier in tiers for heat in heats},
+        max_runs={(tier, heat): rng.randint(1, 6) for tier in tiers for heat in heats},
+        supply_units={(sku, size): rng.randint(5, 60) for sku in skus for size in sku_sizes[sku]},
+        ratio={(sku, size): rng.randint(1, 3) for sku in skus for size in sku_sizes[sku]},
+        cap_runs_total={"A": 7, "B": 5},
+    )
+
+
+def _solve(data: AllocationData, **kwargs):
+    allocation = build_allocation_model(data, **kwargs)
+    allocation.optimize(OutputFlag=0)
+    return allocation
+
+
+def _assert_feasible(data: AllocationData, runs: np.ndarray) -> None:
+    """Check per-door runs against MaxRuns, CapRunsTotal, and SKU×size supply."""
+    for i, door in enumerate(data.doors):
+        tier = data.door_tier[door]
+        for j, sku in enumerate(data.skus):
+            cap = data.eligible.get((door, sku), 0) * data.max_runs[(tier, data.heat[sku])]
+            assert 0 <= runs[i, j] <= cap, (door, sku)
+        assert runs[i].sum() <= data.cap_runs_total.get(tier, np.inf), door
+    for (sku, size), units in data.supply_units.items():
+        j = data.skus.index(sku)
+        assert data.ratio[(sku, size)] * runs[:, j].sum() <= units, (sku, size)
+
+
+@pytest.mark.parametrize("dense", [False, True])
+def test_door_runs_respect_per_door_limits(dense):
+    data = _random_data(seed=3, dense=dense)
+    allocation = _solve(data)
+    runs = allocation.door_runs()
+
+    assert runs.shape == (len(data.doors), len(data.skus))
+    _assert_feasible(data, runs)
+    objective = sum(
+        runs[i, j] * data.score[(data.door_tier[door], data.heat[sku])]
+        for i, door in enumerate(data.doors)
+        for j, sku in enumerate(data.skus)
+    )
+    assert objective == pytest.approx(allocation.model.ObjVal)
+
+
+def test_dense_eligibility_aggregates_doors():
+    data = _random_data(seed=3, dense=True)
+    allocation = _solve(data)
+
+    assert allocation.runs.shape[0] < len(data.doors)
+    assert allocation.class_sizes.sum() == len(data.doors)
+
+
+def test_reuse_model_matches_fresh_build():
+    base = _random_data(seed=5)
+    first = _solve(base, reuse_model=True)
+
+    changed = dataclasses.replace(
+        base,
+        supply_units={key: units // 2 for key, units in base.supply_units.items()},
+        cap_runs_total={"A": 4, "B": 6},
+        heat={sku: "Hype" for sku in base.skus},
+    )
+    reused = _solve(changed, reuse_model=True)
+    fresh = _solve(changed)
+
+    assert reused is first
+    assert reused.model.ObjVal == pytest.approx(fresh.model.ObjVal)
+    _assert_feasible(changed, reused.door_runs())
+
+
+def test_seed_from_door_runs_maps_starts_by_door_and_sku():
+    data = _random_data(seed=7)
+    previous = _solve(data).door_runs()
+    saved = {
+        (door, sku): previous[i, j]
+        for i, door in enumerate(data.doors)
+        for j, sku in enumerate(data.skus)
+        if previous[i, j]
+    }
+
+    # Dropping a door changes the door classes and their order.
+    kept = data.doors[1:]
+    smaller = dataclasses.replace(data, doors=kept)
+    allocation = build_allocation_model(smaller)
+    matched = allocation.seed_from_door_runs(saved)
+
+    expected = {key: value for key, value in saved.items() if key[0] in kept}
+    assert matched == len(expected)
+    allocation.model.update()
+    start = np.asarray(allocation.runs.Start)
+    for j, sku in enumerate(smaller.skus):
+        assert start[:, j].sum() == sum(value for (_, s), value in expected.items() if s == sku)
+
+
+def test_solution_pool_settings_can_be_overridden():
+    allocation = build_allocation_model(_random_data(seed=2))
+    allocation.add_solution_pool(solutions=5)
+    allocation.model.setParam("PoolGap", 0.2)
+    allocation.optimize(OutputFlag=0)
+
+    assert allocation.model.Params.PoolSolutions == 5
+    assert allocation.model.Params.PoolGap == pytest.approx(0.2)
+    assert 1 <= allocation.model.SolCount <= 5
+
+
+@pytest.mark.parametrize("seed", [None, 0, 1, 2])
+def test_greedy_runs_are_feasible(seed):
+    data = _random_data(seed=11)
+    # Fractional ratios and an uncapped tier ("C" has no CapRunsTotal).
+    data = dataclasses.replace(data, ratio={key: value * 0.75 for key, value in data.ratio.items()})
+    assert "C" in set(data.door_tier.values()) and "C" not in data.cap_runs_total
+    rng = None if seed is None else np.random.default_rng(seed)
+
+    runs = _greedy_runs(data, rng)
+
+    _assert_feasible(data, runs)
+    assert runs.sum() > 0
+
+
+def test_constraint_slacks_include_user_added_rows():
+    data = _random_data(seed=3)
+    allocation = build_allocation_model(data)
+    allocation.model.addConstr(allocation.runs.sum() <= 1000, name="total_runs")
+    allocation.optimize(OutputFlag=0)
+
+    slacks = allocation.constraint_slacks()
+
+    assert len(slacks) == allocation.model.NumConstrs
+    assert slacks["name"].iloc[-1] == "total_runs"
+    assert slacks["name"].iloc[0].startswith("supply[")
+
+
+def test_reused_model_starts_from_default_params():
+    clear_model_cache()
+    data = _random_data(seed=9)
+    first = _solve(data, reuse_model=True)
+    first.optimize(OutputFlag=0, MIPFocus=3, Threads=1)
+
+    reused = build_allocation_model(data, reuse_model=True)
+
+    assert reused is first
+    assert reused.model.Params.Threads == 0
+    for param, value in DEFAULT_SOLVER_PARAMS.items():
+        assert reused.model.getParamInfo(param)[2] == value
+
+    clear_model_cache()
+    assert build_allocation_model(data, reuse_model=True) is not first
+
+
+def _summary_by_loop(data: AllocationData, runs: np.ndarray) -> pd.DataFrame:
+    rows = []
+    for i, door in enumerate(data.doors):
+        for j, sku in enumerate(data.skus):
+            if runs[i, j] <= 1e-6:
+                continue
+            for size in data.sku_sizes[sku]:
+                ratio = data.ratio[(sku, size)]
+                rows.append(
+                    {
+                        "door": door,
+                        "sku": sku,
+                        "size": size,
+                        "runs": runs[i, j],
+                        "ratio": ratio,
+                        "units": ratio * runs[i, j],
+                        "score": data.score[(data.door_tier[door], data.heat[sku])],
+                        "heat": data.heat[sku],
+                    }
+                )
+    for row in rows:
+        row["door_size_units"] = sum(
+            other["units"] for other in rows if (other["door"], other["size"]) == (row["door"], row["size"])
+        )
+    return pd.DataFrame(rows)
+
+
+def test_summarize_allocations_matches_loop():
+    data = _random_data(seed=13)
+    data = dataclasses.replace(data, ratio={key: value * 0.75 for key, value in data.ratio.items()})
+    allocation = build_allocation_model(data)
+    allocation.add_solution_pool(solutions=5)
+    allocation.optimize(OutputFlag=0)
+    assert allocation.model.SolCount > 1
+    pool = list(allocation.enumerate_pool())
+
+    for k in [None, allocation.model.SolCount - 1]:
+        runs = pool[0] if k is None else pool[k]
+        pd.testing.assert_frame_equal(
+            allocation.summarize_allocations(solution_number=k),
+            _summary_by_loop(data, runs),
+            check_dtype=False,
+        )
@@ -0,0 +1,127 @@
+import os
+import pickle
+
+import pandas as pd
+
+import run_allocation
+from run_allocation import _load_allocation_data, _read_table, run
+
+
+def _write_doors_csv(data_dir):
+    pd.DataFrame({"door": ["D1", "D2"], "tier": ["A", "B"]}).to_csv(data_dir / "doors.csv", index=False)
+
+
+def test_corrupt_feather_cache_is_a_miss(tmp_path):
+    _write_doors_csv(tmp_path)
+    expected = _read_table(tmp_path, "doors")
+    (cache_path,) = tmp_path.glob("doors.csv.*.feather")
+    cache_path.write_bytes(cache_path.read_bytes()[:10])
+
+    frame = _read_table(tmp_path, "doors")
+
+    pd.testing.assert_frame_equal(frame, expected)
+    pd.testing.assert_frame_equal(pd.read_feather(cache_path), expected)
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_feather_cache_replaces_stale_caches_and_is_shareable(tmp_path):
+    _write_doors_csv(tmp_path)
+    _read_table(tmp_path, "doors")
+    (old_cache,) = tmp_path.glob("doors.csv.*.feather")
+
+    pd.DataFrame({"door": ["D1"], "tier": ["C"]}).to_csv(tmp_path / "doors.csv", index=False)
+    _read_table(tmp_path, "doors")
+
+    (cache_path,) = tmp_path.glob("doors.csv.*.feather")
+    assert cache_path != old_cache
+    umask = os.umask(0)
+    os.umask(umask)
+    assert cache_path.stat().st_mode & 0o777 == 0o666 & ~umask
+
+
+def test_uncacheable_excel_columns_are_still_read(tmp_path):
+    notes = pd.Series([1, "see email"], dtype=object)
+    pd.DataFrame({"door": ["D1", "D2"], "tier": ["A", "B"], "notes": notes}).to_excel(
+        tmp_path / "doors.xlsx", index=False
+    )
+
+    frame = _read_table(tmp_path, "doors")
+
+    assert frame["door"].tolist() == ["D1", "D2"]
+    assert not list(tmp_path.glob("*.feather"))
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_fractional_ratio_is_read(tmp_path):
+    (tmp_path / "supply.csv").write_text("sku,size,supply_units,ratio\nS1,M,10,1.5\n")
+
+    frame = _read_table(tmp_path, "supply")
+
+    assert frame["ratio"].tolist() == [1.5]
+
+
+def _tables():
+    return {
+        "doors": pd.DataFrame({"door": ["D1", "D2"], "tier": ["A", "A"]}),
+        "articles": pd.DataFrame({"sku": ["S1"], "size": ["M"]}),
+        "eligibility": pd.DataFrame({"door": ["D1", "D2"], "sku": ["S1", "S1"], "eligible": [1, 1]}),
+        "supply": pd.DataFrame({"sku": ["S1"], "size": ["M"], "supply_units": [10], "ratio": [1]}),
+        "heat": pd.DataFrame({"sku": ["S1"], "heat": ["Hype"]}),
+        "tier_cap_runs": pd.DataFrame({"tier": ["A"], "heat": ["Hype"], "max_runs": [3], "score": [5]}),
+        "tier_capacity": pd.DataFrame({"tier": ["A"], "cap_runs_total": [4]}),
+    }
+
+
+def test_corrupt_allocation_data_memo_is_a_miss(tmp_path, monkeypatch):
+    monkeypatch.setattr(run_allocation, "DATA_CACHE_DIR", tmp_path)
+    expected = _load_allocation_data(_tables())
+    (memo_path,) = tmp_path.glob("alloc_data_*.pkl")
+    memo_path.write_bytes(memo_path.read_bytes()[:10])
+
+    data = _load_allocation_data(_tables())
+
+    assert data.supply_units == expected.supply_units
+    with memo_path.open("rb") as handle:
+        assert pickle.load(handle).doors == expected.doors
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def _write_tables(data_dir, supply_units):
+    data_dir.mkdir()
+    for name, frame in _tables().items():
+        if name == "supply":
+            frame["supply_units"] = [supply_units]
+        frame.to_csv(data_dir / f"{name}.csv", index=False)
+
+
+def test_slack_report_is_written_only_when_a_row_binds(tmp_path, monkeypatch):
+    monkeypatch.setattr(run_allocation, "DATA_CACHE_DIR", tmp_path / "cache")
+    prefix = tmp_path / "out" / "allocation"
+    slacks_path = tmp_path / "out" / "allocation_slacks.csv"
+
+    # Five units of supply bind before the six runs the doors could take.
+    _write_tables(tmp_path / "tight", supply_units=5)
+    run(tmp_path / "tight", prefix, False)
+    slacks = pd.read_csv(slacks_path)
+    assert slacks.loc[slacks["name"] == "supply[S1,M]", "slack"].tolist() == [0]
+
+    # With ample supply only the per-door MaxRuns bounds bind, so the earlier
+    # report would be stale.
+    _write_tables(tmp_path / "ample", supply_units=10)
+    run(tmp_path / "ample", prefix, False)
+    assert (tmp_path / "out" / "allocation_allocations.csv").exists()
+    assert not slacks_path.exists()
+
+
+def test_stale_pool_alternatives_are_removed(tmp_path, monkeypatch):
+    monkeypatch.setattr(run_allocation, "DATA_CACHE_DIR", tmp_path / "cache")
+    _write_tables(tmp_path / "data", supply_units=5)
+    out = tmp_path / "out"
+    out.mkdir()
+    (out / "allocation_alt7.csv").write_text("stale\n")
+    (out / "allocation_alt7_allocations.csv").write_text("other prefix\n")
+
+    run(tmp_path / "data", out / "allocation", True)
+
+    assert not (out / "allocation_alt7.csv").exists()
+    assert (out / "allocation_alt7_allocations.csv").exists()